@@ -1,4 +1,4 @@
-from helical.benchmark.benchmark import evaluate_classification, evaluate_integration
+from helical.benchmark.benchmark import evaluate_classification, evaluate_integration, _get_classification_evaluations
 from helical.models.classification.classifier import Classifier
 from helical.models.classification.neural_network import NeuralNetwork
 from helical.models.scgpt.model import scGPT
@@ -61,7 +61,21 @@ def test_evaluate_classification(mocker):
     evaluations = evaluate_classification([scgpt_nn_c, scgpt_nn_c], data, "cell_type")
     assert evaluations == {'scGPT with NeuralNetwork': {'Accuracy': 1.0, 'Precision': 1.0, 'F1': 1.0, 'Recall': 1.0}, 
                            'scGPT with NeuralNetwork': {'Accuracy': 1.0, 'Precision': 1.0, 'F1': 1.0, 'Recall': 1.0}}
-    
+
+def test_classification_evaluations_are_not_symmetric_in_their_arguments():
+    """
+    Precision and recall swap when the ground truth and the predictions are swapped,
+    so this catches the arguments being passed to the metrics in the wrong order.
+    """
+    y_true = np.array([0, 0, 1, 1, 1])
+    y_pred = np.array([0, 1, 1, 1, 1])
+
+    evaluation = _get_classification_evaluations(y_true, y_pred)
+    assert_near_exact(evaluation["Accuracy"], 0.8)
+    assert_near_exact(evaluation["Precision"], 0.875)
+    assert_near_exact(evaluation["Recall"], 0.75)
+    assert_near_exact(evaluation["F1"], 0.7619047619047619)
+
 def test_evaluate_integration(mocker):
     """
     Test that the integration evaluation function returns the expected results.
@@ -136,6 +136,29 @@ def test_train_classifier_head(mocker):
     assert scgpt_nn_c.trained_task_model == head 
     assert scgpt_nn_c.gene_names == "index"      
 
+def test_train_classifier_head_stratified_split(mocker):
+    """
+    With stratify=True, the train and test sets passed to the head keep the class proportions of the data.
+    """
+    scgpt = scGPT()
+    data = ad.AnnData(X=np.zeros((20, 5)))
+    data.obs["cell_type"] = ['type1'] * 16 + ['type2'] * 4
+    head = NeuralNetwork()
+
+    mocker.patch.object(scgpt, 'process_data')
+    mocker.patch.object(scgpt, 'get_embeddings')
+    scgpt.get_embeddings.return_value = np.zeros((data.shape[0], 10))
+    mocker.patch.object(head, 'train')
+    head.train.return_value = head
+
+    Classifier().train_classifier_head(data, scgpt, head, labels_column_name = "cell_type", test_size = 0.25, stratify = True)
+    X_train, y_train = head.train.call_args.args
+    X_test, y_test = head.train.call_args.kwargs["validation_data"]
+    assert X_train.shape == (15, 10)
+    assert X_test.shape == (5, 10)
+    assert list(np.unique(y_train, return_counts=True)[1]) == [12, 3]
+    assert list(np.unique(y_test, return_counts=True)[1]) == [4, 1]
+
 
 def test_check_validity_for_training_wrong_column_label_name():
     """
@@ -183,4 +206,25 @@ def test_get_predictions_w_no_base_model(mocker):
     assert c.base_model == None
     assert c.name == name
     assert c.trained_task_model == standalone   
-    assert c.gene_names == "index"    
\ No newline at end of file
+    assert c.gene_names == "index"    
+
+
+def test_neural_network_train_and_predict():
+    """
+    Runs NeuralNetwork.train for real (no mocking) to check that the encoded labels are accepted by the loss and the F1 metric,
+    and that predict returns the original labels.
+    """
+    generator = np.random.default_rng(seed=42)
+    x_train = generator.random((20, 10), dtype=np.float32)
+    x_val = generator.random((6, 10), dtype=np.float32)
+    y_train = np.array(['type1', 'type2'] * 10)
+    y_val = np.array(['type1', 'type2'] * 3)
+
+    head = NeuralNetwork(epochs=1, batch_size=8)
+    head.compile(num_classes=2, input_shape=10)
+    trained_head = head.train(x_train, y_train, validation_data=(x_val, y_val))
+    assert trained_head == head
+
+    predictions = head.predict(x_val)
+    assert predictions.shape == (6,)
+    assert set(predictions) <= {'type1', 'type2'}
@@ -2,6 +2,8 @@ from helical.models.scgpt.model import scGPT, scGPTConfig
 from helical.models.scgpt.fine_tuning_model import scGPTFineTuningModel
 from anndata import AnnData
 from helical.models.scgpt.tokenizer import GeneVocab
+from helical.models.scgpt.data_collator import DataCollator
+import torch
 import pytest
 import anndata as ad
 import numpy as np
@@ -116,4 +118,34 @@ class TestSCGPTModel:
         fine_tuned_model.train(train_input_data=tokenized_dataset, train_labels=labels)
         assert fine_tuned_model is not None
         outputs = fine_tuned_model.get_outputs(tokenized_dataset)
-        assert outputs.shape == (len(self.data), len(labels))
\ No newline at end of file
+        assert outputs.shape == (len(self.data), len(labels))
+
+    def test_fine_tune_looks_up_labels_by_cell_id(self):
+        """
+        The labels of each batch are looked up by the ids of its cells, so the loss must see the labels of the cells in dataset order.
+        """
+        data = AnnData(X=np.array([[1, 2, 5], [3, 1, 0], [0, 4, 2]]))
+        data.var.index = ['SAMD11', 'PLEKHN1', 'HES4']
+        labels = [2, 0, 1]
+
+        seen_labels = []
+        cross_entropy = torch.nn.CrossEntropyLoss()
+        def recording_loss(output, target):
+            seen_labels.extend(target.tolist())
+            return cross_entropy(output, target)
+
+        fine_tuned_model = scGPTFineTuningModel(scGPTConfig(batch_size=2), fine_tuning_head="classification", output_size=3)
+        tokenized_dataset = fine_tuned_model.process_data(data)
+        fine_tuned_model.train(train_input_data=tokenized_dataset, train_labels=labels, loss_function=recording_loss)
+        assert seen_labels == labels
+
+
+def test_data_collator_keeps_the_ids_of_the_examples():
+    collator = DataCollator(do_padding=True, pad_token_id=0, pad_value=-2, do_mlm=False, do_binning=False, max_length=4)
+    examples = [
+        {"id": 5, "genes": torch.tensor([1, 2, 3]), "expressions": torch.tensor([0., 1., 2.])},
+        {"id": 2, "genes": torch.tensor([1, 4]), "expressions": torch.tensor([0., 3.])},
+    ]
+    data_dict = collator(examples)
+    assert data_dict["id"].tolist() == [5, 2]
+    assert data_dict["gene"].shape == (2, 3)
@@ -0,0 +1,29 @@
+from helical.models.uce.model import UCE, UCEConfig
+from anndata import AnnData
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+class TestUCEModel:
+    uce = UCE(UCEConfig(batch_size=1))
+
+    # 'NOT_A_GENE' has no protein embedding and must be filtered out
+    data = AnnData(
+        X=csr_matrix(np.array([[1, 2, 3, 4], [5, 6, 7, 8]])),
+        var=pd.DataFrame(index=["SAMD11", "NOT_A_GENE", "PLEKHN1", "HES4"]),
+    )
+
+    def test_process_data_writes_counts_of_genes_with_embeddings(self, tmp_path, monkeypatch):
+        """
+        The expression counts file must only contain the genes with an embedding,
+        so that its columns line up with the protein embedding rows of the dataset.
+        """
+        monkeypatch.chdir(tmp_path)
+        dataset = self.uce.process_data(self.data.copy(), name="test")
+
+        num_cells, num_genes = dataset.shapes_dict["test"]
+        assert (num_cells, num_genes) == (2, 3)
+        assert dataset.dataset_to_protein_embeddings.shape[0] == num_genes
+
+        counts = np.memmap(tmp_path / "test_counts.npz", dtype='int64', mode='r', shape=(num_cells, num_genes))
+        assert (counts == [[1, 3, 4], [5, 7, 8]]).all()
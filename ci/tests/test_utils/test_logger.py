@@ -0,0 +1,41 @@
+import helical
+import helical.utils.logger as logger_module
+from helical.utils.logger import Logger
+from helical.constants.enums import LoggingType, LoggingLevel
+import logging
+import pytest
+
+@pytest.fixture
+def fresh_file_logging(tmp_path, monkeypatch):
+    """
+    Run the test in a temporary directory with no shared queue handler or listener created yet,
+    and remove the ones the test created from the root logger afterwards.
+    """
+    monkeypatch.chdir(tmp_path)
+    logging.disable(logging.NOTSET)
+    monkeypatch.setattr(logger_module, "_listener", None)
+    monkeypatch.setattr(logger_module, "_queue_handler", None)
+    yield tmp_path
+    logging.getLogger().removeHandler(logger_module._queue_handler)
+    logger_module._stop_listener()
+
+def test_file_logging_writes_to_the_log_file(fresh_file_logging):
+    """
+    After importing helical, which already configures the root logger, a Logger with LoggingType.FILE
+    must still write the records to the log file and keep the handlers of the package.
+    """
+    root_handlers = list(logging.getLogger().handlers)
+
+    logger = Logger(LoggingType.FILE, LoggingLevel.INFO)
+    logging.getLogger("helical.test").info("written to the log file")
+    logger_module._stop_listener()
+
+    assert all(handler in logging.getLogger().handlers for handler in root_handlers)
+    assert "written to the log file" in (fresh_file_logging / logger.log_filename).read_text()
+
+def test_file_logging_shares_one_handler(fresh_file_logging):
+    Logger(LoggingType.FILE, LoggingLevel.INFO)
+    Logger(LoggingType.FILE_AND_CONSOLE, LoggingLevel.INFO)
+
+    queue_handlers = [handler for handler in logging.getLogger().handlers if handler is logger_module._queue_handler]
+    assert len(queue_handlers) == 1
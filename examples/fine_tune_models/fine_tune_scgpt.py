@@ -5,6 +5,7 @@ from omegaconf import DictConfig
 import hydra
 
 
+# To fine-tune on multiple GPUs, run this script with `accelerate launch` (see accelerate_config.yaml) and `++accelerator=True`.
 @hydra.main(version_base=None, config_path="../run_models/configs", config_name="scgpt_config")
 def run_fine_tuning(cfg: DictConfig):
     hf_dataset = load_dataset("helical-ai/yolksac_human",split="train[:5%]", trust_remote_code=True, download_mode="reuse_cache_if_exists")
@@ -16,7 +17,7 @@ def run_fine_tuning(cfg: DictConfig):
     scgpt_config=scGPTConfig(**cfg)
     scgpt_fine_tune = scGPTFineTuningModel(scGPT_config=scgpt_config, fine_tuning_head="classification", output_size=len(label_set))
 
-    dataset = scgpt_fine_tune.process_data(ann_data[:10])
+    dataset = scgpt_fine_tune.process_data(ann_data[:10].copy())
 
     class_id_dict = {label: i for i, label in enumerate(label_set)}
     cell_types = [class_id_dict[cell] for cell in cell_types]
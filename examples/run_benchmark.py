@@ -105,7 +105,7 @@ def run_classification_example(data: AnnData, probing_models: list[str], data_cf
                                                         test_size=0.1,
                                                         random_state=42) 
         evaluations = evaluate_classification([model_c], eval_data, data_cfg["label_key"])
-        evaluations_all.update({model_name: evaluations})
+        evaluations_all[model_name] = evaluations
         # save outputs
         model_c.trained_task_model.save(f"{data_cfg['base_dir']}/{data_cfg['name']}/cell_type_annotation/{model_name}/")        
         write_to_json(evaluations, f"{data_cfg['base_dir']}/{data_cfg['name']}/cell_type_annotation/", f"classification_evaluations_{model_name}")
@@ -3,7 +3,7 @@ from anndata import AnnData
 import logging
 from numpy import ndarray
 import numpy as np
-from sklearn.metrics import accuracy_score, precision_score, f1_score, recall_score
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 from scib.metrics import metrics
 from omegaconf import DictConfig
 from helical.models.base_models import BaseModelProtocol
@@ -60,7 +60,7 @@ def evaluate_integration(model_list: list[tuple[BaseModelProtocol, str]], adata:
                                                   data_cfg["label_key"], 
                                                   embed_obsm_name, 
                                                   **integration_cfg)
-        evaluations.update({model_name: evaluation})
+        evaluations[model_name] = evaluation
     return evaluations
 
 def evaluate_classification(models: list[Classifier], eval_anndata: AnnData, labels_column_name: str) -> dict[str, dict[str, float]]:
@@ -94,13 +94,12 @@ def evaluate_classification(models: list[Classifier], eval_anndata: AnnData, lab
         LOGGER.error(message)
         raise TypeError(message)
 
-    eval_anndata = eval_anndata
     evaluations = {}
     for model in models:
         LOGGER.info(f"Processing classification evaluation embeddings using {model.name}.")
         prediction = model.get_predictions(eval_anndata)
-        evaluation = _get_classification_evaluations(prediction, eval_labels)
-        evaluations.update({model.name: evaluation})
+        evaluation = _get_classification_evaluations(eval_labels, prediction)
+        evaluations[model.name] = evaluation
     return evaluations
 
 def _get_integration_evaluations(adata: AnnData, 
@@ -173,10 +172,12 @@ def _get_classification_evaluations(y_true: ndarray, y_pred: ndarray) -> dict[st
     -------
     A dictionary containing the evaluations.
     """
+    # precision, recall and f1 are computed together from a single pass over the labels
+    precision, recall, f1, _ = precision_recall_fscore_support(y_true, y_pred, average='macro', zero_division=0)
     evaluation = {
         "Accuracy": accuracy_score(y_true, y_pred),
-        "Precision": precision_score(y_true, y_pred, average='macro'),
-        "F1": f1_score(y_true, y_pred, average='macro'),
-        "Recall": recall_score(y_true, y_pred, average='macro'),
+        "Precision": precision,
+        "F1": f1,
+        "Recall": recall,
     }        
     return evaluation
\ No newline at end of file
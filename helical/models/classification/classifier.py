@@ -59,7 +59,8 @@ class Classifier():
                               gene_names: str = "index",
                               labels_column_name: str = "cell_type",
                               test_size: float = 0.2,
-                              random_state: int = 42) -> Self:
+                              random_state: int = 42,
+                              stratify: bool = False) -> Self:
         """Train the classification head. The base model is used to generate the embeddings, which are then used to train the model head.
 
         Parameters
@@ -79,6 +80,9 @@ class Classifier():
             The size of the test set.
         random_state : int
             The random state for the train/test split.
+        stratify : bool
+            Whether to stratify the train/test split by label, so both sets keep the class proportions of the data.
+            Every class then needs at least 2 samples. Default is False.
     
         Raises
         ------
@@ -106,7 +110,10 @@ class Classifier():
         y = np.array(train_anndata.obs[labels_column_name].tolist())
         num_classes = len(np.unique(y))
         
-        X_train, X_test, y_train, y_test = train_test_split(x, y, test_size = test_size, random_state = random_state)
+        # split the indices once and index the features and labels with them
+        indices = np.arange(len(y))
+        train_idx, test_idx = train_test_split(indices, test_size = test_size, random_state = random_state, stratify = y if stratify else None)
+        X_train, X_test, y_train, y_test = x[train_idx], x[test_idx], y[train_idx], y[test_idx]
         head.compile(num_classes, x.shape[1])
         self.trained_task_model = head.train(X_train, y_train, validation_data=(X_test, y_test))
        
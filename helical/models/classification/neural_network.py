@@ -11,6 +11,8 @@ from tensorflow.keras.utils import to_categorical
 from helical.models.base_models import BaseTaskModel
 from pathlib import Path
 
+PREDICTION_CHUNK_SIZE = 8192
+
 class NeuralNetwork(BaseTaskModel):
     def __init__(self, loss: str = "categorical_crossentropy", learning_rate: float = 0.001, epochs=10, batch_size=32) -> None:
         self.loss = loss
@@ -62,7 +64,7 @@ class NeuralNetwork(BaseTaskModel):
         The neural network instance.
         """
         x_val, y_val = validation_data
-        self.encoder.fit_transform(np.concatenate((y_train, y_val), axis = 0))
+        self.encoder.fit(np.concatenate((y_train, y_val), axis = 0))
 
         y_train_encoded = self.encoder.transform(y_train)
         y_train_encoded = to_categorical(y_train_encoded, num_classes = self.num_classes)
@@ -85,8 +87,12 @@ class NeuralNetwork(BaseTaskModel):
         -------
         The prediction of the neural network.
         """
-        predictions = self.model.predict(x)
-        y_pred = np.argmax(predictions, axis=1)
+        # predict in chunks and only keep the argmax of each, so the full (n_samples, n_classes)
+        # probability matrix is never held in memory
+        y_pred = np.empty(x.shape[0], dtype=np.int32)
+        for start in range(0, x.shape[0], PREDICTION_CHUNK_SIZE):
+            end = start + PREDICTION_CHUNK_SIZE
+            y_pred[start:end] = np.argmax(self.model.predict_on_batch(x[start:end]), axis=1)
         return self.encoder.inverse_transform(y_pred)
     
     def save(self, path: str) -> None:
@@ -73,7 +73,7 @@ class SupportVectorMachine(BaseTaskModel):
         os.makedirs(os.path.dirname(path), exist_ok=True)  
         file = f"{path}svm.h5"
         with open(file, 'wb') as f:
-            pickle.dump(self.svm_model, f)
+            pickle.dump(self.svm_model, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def load(self, path: str) -> Self:
         """Load the SVM model from a file.
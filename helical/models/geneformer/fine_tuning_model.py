@@ -163,8 +163,8 @@ class GeneformerFineTuningModel(HelicalBaseFineTuningModel, Geneformer):
                 
         model_input_size = get_model_input_size(self.model)
 
-        cls_present = any("<cls>" in key for key in self.gene_token_dict.keys())
-        eos_present = any("<eos>" in key for key in self.gene_token_dict.keys())
+        cls_present = self.cls_present
+        eos_present = self.eos_present
         if self.emb_mode == "cls":
             if cls_present is False:
                 message = "<cls> token missing in token dictionary"
@@ -294,8 +294,8 @@ class GeneformerFineTuningModel(HelicalBaseFineTuningModel, Geneformer):
 
         dataset_length = len(dataset)
 
-        cls_present = any("<cls>" in key for key in self.gene_token_dict.keys())
-        eos_present = any("<eos>" in key for key in self.gene_token_dict.keys())
+        cls_present = self.cls_present
+        eos_present = self.eos_present
         if self.emb_mode == "cls":
             if cls_present is False:
                 message = "<cls> token missing in token dictionary"
@@ -1,3 +1,4 @@
+import os
 from typing import Optional
 from pathlib import Path
 from helical.constants.paths import CACHE_DIR_HELICAL
@@ -20,13 +21,18 @@ class GeneformerConfig():
         The device to use. Either use "cuda" or "cpu".
     accelerator : bool, optional, default=False
         The accelerator configuration. By default same device as model.
-    nproc: int, optional, default=1
+    nproc: int, optional, default=None
         Number of processes to use for data processing.
+        If None, half of the available CPU cores are used.
     custom_attr_name_dict : dict, optional, default=None
         A dictionary that contains the names of the custom attributes to be added to the dataset. 
         The keys of the dictionary are the names of the custom attributes, and the values are the names of the columns in adata.obs. 
         For example, if you want to add a custom attribute called "cell_type" to the dataset, you would pass custom_attr_name_dict = {"cell_type": "cell_type"}.
         If you do not want to add any custom attributes, you can leave this parameter as None.
+    mixed_precision : bool, optional, default=False
+        Whether to run inference on "cuda" devices in half precision (bf16 where supported, fp16 otherwise).
+        This is faster and uses less memory, but the embeddings can differ slightly from full precision ones.
+        Ignored on "cpu".
     Returns
     -------
     GeneformerConfig
@@ -41,8 +47,9 @@ class GeneformerConfig():
             emb_mode: Literal["cls", "cell", "gene"] = "cell",
             device: Literal["cpu", "cuda"] = "cpu",
             accelerator: Optional[bool] = False,
-            nproc: int = 1,
-            custom_attr_name_dict: Optional[dict] = None
+            nproc: Optional[int] = None,
+            custom_attr_name_dict: Optional[dict] = None,
+            mixed_precision: bool = False
             ):
         
         # model specific parameters
@@ -74,6 +81,9 @@ class GeneformerConfig():
             },
 
         }
+        if nproc is None:
+            nproc = max(1, (os.cpu_count() or 2) // 2)
+
         if model_name not in self.model_map:
             raise ValueError(f"Model name {model_name} not found in available models: {self.model_map.keys()}")
         
@@ -117,7 +127,8 @@ class GeneformerConfig():
             "special_token": self.model_map[model_name]["special_token"],
             "embsize": self.model_map[model_name]["embsize"],
             "nproc": nproc,
-            "custom_attr_name_dict": custom_attr_name_dict
+            "custom_attr_name_dict": custom_attr_name_dict,
+            "mixed_precision": mixed_precision
         }
     
 
@@ -47,6 +47,7 @@ import os
 import logging
 import pickle
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 from collections import Counter
@@ -63,6 +64,17 @@ warnings.filterwarnings("ignore", message=".*The 'nopython' keyword.*")
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def load_pickle(path):
+    """
+    Load a pickled dictionary (e.g. the token, gene median or gene mapping dictionary).
+    The result is cached, so the same file is only unpickled once per process and the
+    dictionary is shared between the models and tokenizers using it. It must not be modified in place.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
 def rank_genes(gene_vector, gene_tokens):
     """
     Rank gene expression vector.
@@ -122,9 +134,9 @@ def sum_ensembl_ids(
             else:
                 raise ValueError("Error: data Ensembl IDs non-unique.")
 
-        gene_ids_collapsed = [
-            gene_mapping_dict.get(str(gene_id).upper()) for gene_id in data.var.ensembl_id
-        ]
+        gene_ids_collapsed = (
+            data.var.ensembl_id.astype(str).str.upper().map(gene_mapping_dict).tolist()
+        )
         gene_ids_collapsed_in_dict = [
             gene for gene in gene_ids_collapsed if gene in gene_token_dict.keys()
         ]
@@ -249,12 +261,10 @@ class TranscriptomeTokenizer:
 
         # load dictionary of gene normalization factors
         # (non-zero median value of expression across Genecorpus-30M)
-        with open(gene_median_file, "rb") as f:
-            self.gene_median_dict = pickle.load(f)
+        self.gene_median_dict = load_pickle(gene_median_file)
 
         # load token dictionary (Ensembl IDs:token)
-        with open(token_dictionary_file, "rb") as f:
-            self.gene_token_dict = pickle.load(f)
+        self.gene_token_dict = load_pickle(token_dictionary_file)
 
         # check for special token in gene_token_dict
         if self.special_token:
@@ -279,8 +289,7 @@ class TranscriptomeTokenizer:
 
         # load gene mappings dictionary (Ensembl IDs:Ensembl ID)
         if gene_mapping_file is not None:
-            with open(gene_mapping_file, "rb") as f:
-                self.gene_mapping_dict = pickle.load(f)
+            self.gene_mapping_dict = load_pickle(gene_mapping_file)
         else:
             self.gene_mapping_dict = {k: k for k, _ in self.gene_token_dict.items()}
 
@@ -293,9 +302,6 @@ class TranscriptomeTokenizer:
             k: v for k, v in self.gene_mapping_dict.items() if v in gene_keys_set
         }
 
-        # protein-coding and miRNA gene list dictionary for selecting .h5ad columns for tokenization
-        self.genelist_dict = dict(zip(self.gene_keys, [True] * len(self.gene_keys)))
-
 
     def tokenize_data(
         self,
@@ -410,7 +416,7 @@ class TranscriptomeTokenizer:
             }
 
         coding_miRNA_loc = np.where(
-            [self.genelist_dict.get(i, False) for i in adata.var["ensembl_id"]]
+            adata.var["ensembl_id"].isin(self.gene_keys).to_numpy()
         )[0]
         norm_factor_vector = np.array(
             [
@@ -431,12 +437,12 @@ class TranscriptomeTokenizer:
             var_exists = True
 
         if var_exists:
-            filter_pass_loc = np.where([i == 1 for i in adata.obs["filter_pass"]])[0]
+            filter_pass_loc = np.where(adata.obs["filter_pass"].to_numpy() == 1)[0]
         elif not var_exists:
             LOGGER.info(
                 f"{adata_obj} has no column attribute 'filter_pass'; tokenizing all cells."
             )
-            filter_pass_loc = np.array([i for i in range(adata.shape[0])])
+            filter_pass_loc = np.arange(adata.shape[0])
 
         tokenized_cells = []
         
@@ -507,33 +513,33 @@ class TranscriptomeTokenizer:
         else:
             output_dataset = Dataset.from_dict(dataset_dict)
 
-        def format_cell_features(example):
+        cls_token_id = self.gene_token_dict.get("<cls>")
+        eos_token_id = self.gene_token_dict.get("<eos>")
+
+        def format_cell_features(examples):
             # Store original uncropped input_ids in separate feature
             if keep_uncropped_input_ids:
-                example["input_ids_uncropped"] = example["input_ids"]
-                example["length_uncropped"] = len(example["input_ids"])
+                examples["input_ids_uncropped"] = examples["input_ids"]
+                examples["length_uncropped"] = [len(input_ids) for input_ids in examples["input_ids"]]
 
             # Truncate/Crop input_ids to input size
             if self.special_token:
-                example["input_ids"] = example["input_ids"][
-                    0 : self.model_input_size - 2
-                ]  # truncate to leave space for CLS and EOS token
-                example["input_ids"] = np.insert(
-                    example["input_ids"], 0, self.gene_token_dict.get("<cls>")
-                )
-                example["input_ids"] = np.insert(
-                    example["input_ids"],
-                    len(example["input_ids"]),
-                    self.gene_token_dict.get("<eos>"),
-                )
+                # truncate to leave space for CLS and EOS token
+                examples["input_ids"] = [
+                    np.concatenate(([cls_token_id], input_ids[0 : self.model_input_size - 2], [eos_token_id]))
+                    for input_ids in examples["input_ids"]
+                ]
             else:
-                # Truncate/Crop input_ids to input size
-                example["input_ids"] = example["input_ids"][0 : self.model_input_size]
-            example["length"] = len(example["input_ids"])
+                examples["input_ids"] = [
+                    input_ids[0 : self.model_input_size] for input_ids in examples["input_ids"]
+                ]
+            examples["length"] = [len(input_ids) for input_ids in examples["input_ids"]]
 
-            return example
+            return examples
 
+        # only spawn as many processes as there are chunks of cells to work on
+        num_proc = min(self.nproc, max(1, len(output_dataset) // self.chunk_size))
         output_dataset_truncated = output_dataset.map(
-            format_cell_features, num_proc=self.nproc
+            format_cell_features, batched=True, batch_size=1024, num_proc=num_proc
         )
         return output_dataset_truncated
@@ -32,7 +32,8 @@ def load_mappings(gene_symbols):
         gene_id_to_ensemble.update(decoded)
         # print(repr(decoded))
 
-    pkl.dump(gene_id_to_ensemble, open('./human_gene_to_ensemble_id.pkl', 'wb'))
+    with open('./human_gene_to_ensemble_id.pkl', 'wb') as f:
+        pkl.dump(gene_id_to_ensemble, f, protocol=pkl.HIGHEST_PROTOCOL)
     return gene_id_to_ensemble
 
 
@@ -54,8 +55,8 @@ def get_embs(
     embs_list = []
 
     #  Check if CLS and EOS token is present in the token dictionary
-    cls_present = any("<cls>" in key for key in gene_token_dict.keys())
-    eos_present = any("<eos>" in key for key in gene_token_dict.keys())
+    cls_present = "<cls>" in gene_token_dict
+    eos_present = "<eos>" in gene_token_dict
     if emb_mode == "cls":
         assert cls_present, "<cls> token missing in token dictionary"
         # Check to make sure that the first token of the filtered input data is cls token
@@ -4,15 +4,17 @@ from pathlib import Path
 import numpy as np
 from anndata import AnnData
 from helical.utils.downloader import Downloader
-import pickle
 from transformers import BertForMaskedLM
-from helical.models.geneformer.geneformer_utils import get_embs,quant_layers
-from helical.models.geneformer.geneformer_tokenizer import TranscriptomeTokenizer
+from helical.models.geneformer.geneformer_utils import get_embs,quant_layers,get_model_input_size,pad_tensor_list,pad_3d_tensor
+from helical.models.geneformer.geneformer_tokenizer import TranscriptomeTokenizer, load_pickle
 from helical.models.geneformer.geneformer_config import GeneformerConfig
 from helical.utils.mapping import map_gene_symbols_to_ensembl_ids
 from datasets import Dataset
 from typing import Optional
+from contextlib import nullcontext
 from accelerate import Accelerator
+from accelerate.utils import gather_object
+import torch
 
 LOGGER = logging.getLogger(__name__)
 class Geneformer(HelicalRNAModel):
@@ -99,9 +101,10 @@ class Geneformer(HelicalRNAModel):
             self.accelerator = None
 
         # load token dictionary (Ensembl IDs:token)
-        with open(self.files_config["token_path"], "rb") as f:
-            self.gene_token_dict = pickle.load(f)
-            self.pad_token_id = self.gene_token_dict.get("<pad>")
+        self.gene_token_dict = load_pickle(self.files_config["token_path"])
+        self.pad_token_id = self.gene_token_dict.get("<pad>")
+        self.cls_present = "<cls>" in self.gene_token_dict
+        self.eos_present = "<eos>" in self.gene_token_dict
 
         self.tk = TranscriptomeTokenizer(custom_attr_name_dict=self.config["custom_attr_name_dict"],
                                          nproc=self.config['nproc'], 
@@ -186,15 +189,68 @@ class Geneformer(HelicalRNAModel):
             The gene embeddings in the form of a numpy array
         """
         LOGGER.info(f"Inference started:")
-        embeddings = get_embs(
-            self.model,
-            dataset,
-            self.emb_mode,
-            self.layer_to_quant,
-            self.pad_token_id,
-            self.forward_batch_size,
-            self.gene_token_dict,
-            self.device
-        ).cpu().detach().numpy()
-
-        return embeddings
+
+        # if enabled, run the forward passes on GPUs in half precision (bf16 where supported, fp16 otherwise)
+        # the autocast context is only created when used, as creating it for "cuda" on a host without CUDA warns even when disabled
+        if self.config["mixed_precision"] and str(self.device).startswith("cuda") and torch.cuda.is_available():
+            autocast_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            autocast = torch.autocast(device_type="cuda", dtype=autocast_dtype)
+        else:
+            autocast = nullcontext()
+
+        with torch.inference_mode(), autocast:
+            if self.accelerator is not None and self.accelerator.num_processes > 1:
+                embeddings = self._get_distributed_embeddings(dataset)
+            else:
+                embeddings = get_embs(
+                    self.model,
+                    dataset,
+                    self.emb_mode,
+                    self.layer_to_quant,
+                    self.pad_token_id,
+                    self.forward_batch_size,
+                    self.gene_token_dict,
+                    self.device
+                )
+
+        # cast back to float32 so that downstream consumers get the same dtype as before
+        return embeddings.float().cpu().numpy()
+
+    def _get_distributed_embeddings(self, dataset: Dataset) -> torch.Tensor:
+        """Splits the dataset between the processes of the accelerator, gets the embeddings of each shard
+        on its own device and gathers them back, in the original order, on every process.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The tokenized dataset containing the processed data
+
+        Returns
+        -------
+        torch.Tensor
+            The gene embeddings of the whole dataset
+        """
+        # inference does not need gradient synchronisation, so the unwrapped model is used on each process
+        model = self.accelerator.unwrap_model(self.model)
+        with self.accelerator.split_between_processes(list(range(len(dataset)))) as shard_indices:
+            shard_embeddings = None
+            if len(shard_indices) > 0:
+                shard_embeddings = get_embs(
+                    model,
+                    dataset.select(shard_indices),
+                    self.emb_mode,
+                    self.layer_to_quant,
+                    self.pad_token_id,
+                    self.forward_batch_size,
+                    self.gene_token_dict,
+                    self.accelerator.device,
+                    silent=not self.accelerator.is_local_main_process
+                ).cpu()
+
+        all_embeddings = [embs for embs in gather_object([shard_embeddings]) if embs is not None]
+
+        # gene embeddings of each shard are padded to their own longest sequence
+        if self.emb_mode == "gene":
+            max_len = max(embs.size(1) for embs in all_embeddings)
+            return pad_tensor_list(all_embeddings, max_len, self.pad_token_id, get_model_input_size(model), 1, pad_3d_tensor)
+        return torch.cat(all_embeddings, dim=0)
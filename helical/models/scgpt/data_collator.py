@@ -99,6 +99,7 @@ class DataCollator:
         padded_expressions = torch.stack(padded_expressions, dim=0).to(device)
 
         data_dict = {
+            "id": torch.tensor([example["id"] for example in examples], dtype=torch.long),
             "gene": padded_genes,
             "expr": padded_expressions,
         }
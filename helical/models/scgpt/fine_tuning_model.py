@@ -7,6 +7,7 @@ from torch.nn.modules import loss
 from torch.utils.data import DataLoader, SequentialSampler
 from tqdm import tqdm
 from transformers import get_scheduler
+from accelerate.utils import broadcast
 from helical.models.base_models import HelicalBaseFineTuningHead
 from helical.models.scgpt import scGPT, scGPTConfig
 from helical.models.base_models import HelicalBaseFineTuningModel
@@ -102,7 +103,9 @@ class scGPTFineTuningModel(HelicalBaseFineTuningModel, scGPT):
         torch.Tensor
             The output tensor of the fine-tuning model.
         """
-        embeddings = self.model._encode(
+        # the model may have been wrapped for distributed training by the accelerator
+        model = self.accelerator.unwrap_model(self.model) if self.accelerator is not None else self.model
+        embeddings = model._encode(
             input_gene_ids,
             data_dict["expr"].to(device),
             src_key_padding_mask=src_key_padding_mask,
@@ -113,6 +116,32 @@ class scGPTFineTuningModel(HelicalBaseFineTuningModel, scGPT):
         cls_emb = embeddings[:, 0, :]
         output = self.fine_tuning_head(cls_emb)
         return output
+
+    def _broadcast_parameters_from_main_process(self) -> None:
+        """
+        Copy the parameters of the main process to all other accelerator processes, so that every process starts from the same weights.
+        The fine-tuning head is built separately on each process and, unlike the wrapped base model, is not broadcast when it is prepared.
+        """
+        if self.accelerator.num_processes == 1:
+            return
+        with torch.no_grad():
+            for parameter in self.parameters():
+                parameter.copy_(broadcast(parameter.detach(), from_process=0))
+
+    def _average_gradients_across_processes(self) -> None:
+        """
+        Average the gradients of all parameters across the accelerator processes, so that every process applies the same update.
+        The forward pass does not go through a distributed wrapper, hence the gradients are not synchronised automatically.
+        """
+        if self.accelerator.num_processes == 1:
+            return
+        grads = [parameter.grad for parameter in self.parameters() if parameter.grad is not None]
+        if not grads:
+            return
+        # reduce all gradients in one collective call over a single flat buffer instead of one call per parameter
+        flat_grads = self.accelerator.reduce(torch.cat([grad.flatten() for grad in grads]), reduction="mean")
+        for grad, synced_grad in zip(grads, flat_grads.split([grad.numel() for grad in grads])):
+            grad.copy_(synced_grad.view_as(grad))
     
     def train(
         self,
@@ -150,10 +179,21 @@ class scGPTFineTuningModel(HelicalBaseFineTuningModel, scGPT):
         lr_scheduler_params : dict, default = None
             The learning rate scheduler parameters for the transformers get_scheduler method. The optimizer will be taken from the optimizer input and should not be included in the learning scheduler parameters. If not specified, no scheduler will be used.
             e.g. lr_scheduler_params = { 'name': 'linear', 'num_warmup_steps': 0, 'num_training_steps': 5 }
+
+        Notes
+        -----
+        If the model was configured with `accelerator=True`, the data loaders and the optimizer are prepared by the accelerator.
+        When launched with `accelerate launch` on multiple GPUs, each process trains on its own shard of the data, starting from the parameters of the main process, and the gradients are averaged across processes.
+        The mixed precision setting of the accelerate configuration (e.g. bf16) is applied to the forward and backward passes.
         """
         
         device = next(self.model.parameters()).device
 
+        # labels are looked up by the ids of the cells in each batch, so that they stay aligned when the data is sharded
+        train_labels = torch.as_tensor(np.asarray(train_labels))
+        if validation_labels is not None:
+            validation_labels = torch.as_tensor(np.asarray(validation_labels))
+
         try:
             use_batch_labels = train_input_data.batch_ids is not None
         except:
@@ -194,26 +234,41 @@ class scGPTFineTuningModel(HelicalBaseFineTuningModel, scGPT):
         self.fine_tuning_head.train()
         optimizer = optimizer(self.parameters(), **optimizer_params)
 
+        if self.accelerator is not None:
+            device = self.accelerator.device
+            optimizer, data_loader = self.accelerator.prepare(optimizer, data_loader)
+            if validation_input_data is not None:
+                validation_data_loader = self.accelerator.prepare(validation_data_loader)
+            self._broadcast_parameters_from_main_process()
+
         lr_scheduler = None
         if lr_scheduler_params is not None: 
             lr_scheduler = get_scheduler(optimizer=optimizer, **lr_scheduler_params)
 
+        # only show the progress bars on the main process when training on multiple processes
+        disable_progress_bar = self.accelerator is not None and not self.accelerator.is_local_main_process
+
         logger.info("Starting Fine-Tuning")
         for j in range(epochs):
-            batch_count = 0
             batch_loss = 0.0
             batches_processed = 0
-            training_loop = tqdm(data_loader)
+            training_loop = tqdm(data_loader, disable=disable_progress_bar)
             for data_dict in training_loop:
                 input_gene_ids = data_dict["gene"].to(device)
                 src_key_padding_mask = input_gene_ids.eq(
                     self.vocab[self.config["pad_token"]]
                 )
-                output = self._forward(input_gene_ids, data_dict, src_key_padding_mask, use_batch_labels, device)
-                labels = torch.tensor(train_labels[batch_count: batch_count + self.config["batch_size"]], device=device)
-                batch_count += self.config["batch_size"]
-                loss = loss_function(output, labels)
-                loss.backward()
+                labels = train_labels[data_dict["id"].cpu()].to(device)
+                if self.accelerator is not None:
+                    with self.accelerator.autocast():
+                        output = self._forward(input_gene_ids, data_dict, src_key_padding_mask, use_batch_labels, device)
+                        loss = loss_function(output, labels)
+                    self.accelerator.backward(loss)
+                    self._average_gradients_across_processes()
+                else:
+                    output = self._forward(input_gene_ids, data_dict, src_key_padding_mask, use_batch_labels, device)
+                    loss = loss_function(output, labels)
+                    loss.backward()
                 batch_loss += loss.item()
                 batches_processed += 1
                 optimizer.step()
@@ -226,21 +281,25 @@ class scGPTFineTuningModel(HelicalBaseFineTuningModel, scGPT):
                 lr_scheduler.step()
 
             if validation_input_data is not None:
-                testing_loop = tqdm(validation_data_loader, desc="Fine-Tuning Validation")
+                testing_loop = tqdm(validation_data_loader, desc="Fine-Tuning Validation", disable=disable_progress_bar)
                 val_loss = 0.0
                 count = 0.0
-                validation_batch_count = 0
                 for validation_data_dict in testing_loop:
                     input_gene_ids = validation_data_dict["gene"].to(device)
                     src_key_padding_mask = input_gene_ids.eq(
                         self.vocab[self.config["pad_token"]]
                     )
                     output = self._forward(input_gene_ids, validation_data_dict, src_key_padding_mask, use_batch_labels, device)
-                    val_labels = torch.tensor(validation_labels[validation_batch_count: validation_batch_count + self.config["batch_size"]], device=device)
+                    val_labels = validation_labels[validation_data_dict["id"].cpu()].to(device)
                     val_loss += loss_function(output, val_labels).item()
-                    validation_batch_count += self.config["batch_size"]
                     count += 1.0
                     testing_loop.set_postfix({"val_loss": val_loss/count})
+
+                # each process only saw its own shard of the validation data, so sum the losses and counts over all of them
+                if self.accelerator is not None and self.accelerator.num_processes > 1:
+                    val_loss, count = self.accelerator.reduce(torch.tensor([val_loss, count], device=device), reduction="sum").tolist()
+                    if self.accelerator.is_main_process:
+                        logger.info(f"Fine-Tuning Validation: epoch {j+1}/{epochs}, val_loss: {val_loss/count}")
         logger.info(f"Fine-Tuning Complete. Epochs: {epochs}")
 
     def get_outputs(
@@ -27,7 +27,8 @@ class GeneEmbedding(object):
 
     def read_embedding(self, filename):
         embedding = dict()
-        lines = open(filename, "r").read().splitlines()[1:]
+        with open(filename, "r") as f:
+            lines = f.read().splitlines()[1:]
         for line in lines:
             vector = line.split()
             gene = vector.pop(0)
@@ -233,7 +234,8 @@ class GeneEmbedding(object):
 
     @staticmethod
     def read_vector(vec):
-        lines = open(vec, "r").read().splitlines()
+        with open(vec, "r") as f:
+            lines = f.read().splitlines()
         dims = lines.pop(0)
         vecs = dict()
         for line in lines:
@@ -282,16 +284,15 @@ class GeneEmbedding(object):
 
     @staticmethod
     def average_vector_results(vec1, vec2, fname):
-        output = open(fname, "w")
         vec1, dims = GeneEmbedding.read_vector(vec1)
         vec2, _ = GeneEmbedding.read_vector(vec2)
         genes = list(vec1.keys())
-        output.write(dims + "\n")
-        for gene in genes:
-            v1 = vec1[gene]
-            v2 = vec2[gene]
-            meanv = []
-            for x, y in zip(v1, v2):
-                meanv.append(str((x + y) / 2))
-            output.write("{} {}\n".format(gene, " ".join(meanv)))
-        output.close()
+        with open(fname, "w") as output:
+            output.write(dims + "\n")
+            for gene in genes:
+                v1 = vec1[gene]
+                v2 = vec2[gene]
+                meanv = []
+                for x, y in zip(v1, v2):
+                    meanv.append(str((x + y) / 2))
+                output.write("{} {}\n".format(gene, " ".join(meanv)))
@@ -176,23 +176,23 @@ class Preprocessor:
                     "Binning arg must be an integer, but got {}.".format(self.binning)
                 )
             n_bins = self.binning  # NOTE: the first bin is always a spectial for zero
-            binned_rows = []
-            bin_edges = []
             layer_data = _get_obs_rep(adata, layer=key_to_process)
             layer_data = layer_data.A if issparse(layer_data) else layer_data
             if layer_data.min() < 0:
                 raise ValueError(
                     f"Assuming non-negative data, but got min value {layer_data.min()}."
                 )
-            for row in layer_data:
+            # allocate the outputs once and fill them row by row, instead of
+            # collecting per-row arrays and copying them all again with np.stack
+            binned_rows = np.zeros(layer_data.shape, dtype=np.int64)
+            bin_edges = np.zeros((layer_data.shape[0], n_bins))
+            for i, row in enumerate(layer_data):
                 if row.max() == 0:
                     logger.warning(
                         "The input data contains all zero rows. Please make sure "
                         "this is expected. You can use the `filter_cell_by_counts` "
                         "arg to filter out all zero rows."
                     )
-                    binned_rows.append(np.zeros_like(row, dtype=np.int64))
-                    bin_edges.append(np.array([0] * n_bins))
                     continue
                 non_zero_ids = row.nonzero()
                 non_zero_row = row[non_zero_ids]
@@ -203,12 +203,10 @@ class Preprocessor:
                 non_zero_digits = _digitize(non_zero_row, bins)
                 assert non_zero_digits.min() >= 1
                 assert non_zero_digits.max() <= n_bins - 1
-                binned_row = np.zeros_like(row, dtype=np.int64)
-                binned_row[non_zero_ids] = non_zero_digits
-                binned_rows.append(binned_row)
-                bin_edges.append(np.concatenate([[0], bins]))
-            adata.layers[self.result_binned_key] = np.stack(binned_rows)
-            adata.obsm["bin_edges"] = np.stack(bin_edges)
+                binned_rows[i][non_zero_ids] = non_zero_digits
+                bin_edges[i, 1:] = bins
+            adata.layers[self.result_binned_key] = binned_rows
+            adata.obsm["bin_edges"] = bin_edges
 
     def check_logged(self, adata: AnnData, obs_key: Optional[str] = None) -> bool:
         """
@@ -97,10 +97,6 @@ class UCEFineTuningModel(HelicalBaseFineTuningModel, UCE):
         if self.accelerator is not None:
             self.accelerator.wait_for_everyone()
             embeddings = self.accelerator.gather_for_metrics((embeddings))
-            if self.accelerator.is_main_process:
-                embeddings = embeddings
-        else:
-            embeddings = embeddings
         output = self.fine_tuning_head(embeddings)
         return output
     
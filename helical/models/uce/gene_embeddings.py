@@ -2,8 +2,10 @@
     Helper functions for loading pretrained gene embeddings.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Tuple
+import numpy as np
 import torch
 from scanpy import AnnData
 import logging
@@ -26,6 +28,17 @@ def get_gene_embedding_paths(embedding_path: Path) -> Dict[str, Dict[str, Path]]
                 res[model][species] = embedding_path / file
     return res
 
+@lru_cache(maxsize=16)
+def _load_species_gene_embeddings(path: Path) -> Dict[str, torch.Tensor]:
+    """
+    Load the gene embeddings file of a species.
+    The result is cached so that repeated calls for the same species do not read and unpickle the file again.
+
+    :param path: The path to the gene embeddings file of the species.
+    :return: A dictionary mapping gene symbols to their embeddings.
+    """
+    return torch.load(path, map_location="cpu", weights_only=True)
+
 #TODO Add new function to add embeddings
 # extra_species = pd.read_csv("./UCE/model_files/new_species_protein_embeddings.csv").set_index("species").to_dict()["path"]
 # MODEL_TO_SPECIES_TO_GENE_EMBEDDING_PATH["ESM2"].update(extra_species) # adds new species
@@ -56,26 +69,31 @@ def load_gene_embeddings_adata(adata: AnnData, species: list, embedding_model: s
     if not (species_names_set <= available_species):
         logger.error(f'Missing gene embeddings here: {embeddings_path}')
         raise ValueError(f'The following species do not have gene embeddings: {species_names_set - available_species}')
-    # Load gene embeddings for desired species (and convert gene symbols to lower case)
+    # Only the genes in the data are looked up, so lower case their symbols once
+    lower_var_names = [gene_symbol.lower() for gene_symbol in adata.var_names]
+    data_gene_symbols = set(lower_var_names)
+
+    # Load gene embeddings for desired species (and convert gene symbols to lower case),
+    # keeping only the genes present in the data
     species_to_gene_symbol_to_embedding = {
         species: {
-            gene_symbol.lower(): gene_embedding
-            for gene_symbol, gene_embedding in torch.load(species_to_gene_embedding_path[species]).items()
+            lower_gene_symbol: gene_embedding
+            for gene_symbol, gene_embedding in _load_species_gene_embeddings(species_to_gene_embedding_path[species]).items()
+            if (lower_gene_symbol := gene_symbol.lower()) in data_gene_symbols
         }
         for species in species_names
     }
 
     logger.info(f'Finished loading gene embeddings for {species_names_set} from {embeddings_path}')
 
-    # Determine which genes to include based on gene expression and embedding availability
-    genes_with_embeddings = set.intersection(*[
-        set(gene_symbol_to_embedding)
-        for gene_symbol_to_embedding in species_to_gene_symbol_to_embedding.values()
-    ])
-    genes_to_use = {gene for gene in adata.var_names if gene.lower() in genes_with_embeddings}
+    # Determine which genes to include based on gene expression and embedding availability in all species
+    genes_to_use = np.ones(len(lower_var_names), dtype=bool)
+    for gene_symbol_to_embedding in species_to_gene_symbol_to_embedding.values():
+        genes_to_use &= np.fromiter((gene in gene_symbol_to_embedding for gene in lower_var_names), dtype=bool, count=len(lower_var_names))
     
-    # Subset data to only use genes with embeddings
-    filtered_adata = adata[:, adata.var_names.isin(genes_to_use)]
+    # Subset data to only use genes with embeddings,
+    # copied once here so that later accesses to .X do not resolve the view again each time
+    filtered_adata = adata[:, genes_to_use].copy()
     filtered = adata.var_names.shape[0] - filtered_adata.var_names.shape[0]
     logger.info(f'Filtered out {filtered} genes to a total of {filtered_adata.var_names.shape[0]} genes with embeddings.')
 
@@ -83,7 +101,7 @@ def load_gene_embeddings_adata(adata: AnnData, species: list, embedding_model: s
     species_to_all_gene_symbols = {
         species: [
             gene_symbol.lower()
-            for gene_symbol, _ in torch.load(species_to_gene_embedding_path[species]).items()
+            for gene_symbol, _ in _load_species_gene_embeddings(species_to_gene_embedding_path[species]).items()
         ]
         for species in species_names
     }
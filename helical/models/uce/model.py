@@ -134,7 +134,7 @@ class UCE(HelicalRNAModel):
                                                                         embedding_model=self.config["gene_embedding_model"],
                                                                         embeddings_path=Path(files_config["protein_embeddings_dir"]))
         # TODO: What about hv_genes? See orig.
-        gene_expression = adata.X.toarray()
+        gene_expression = filtered_adata.X.toarray()
 
         name = name
         gene_expression_folder_path = "./"
@@ -74,7 +74,12 @@ def get_protein_embeddings_idxs(offset_pkl_path: str, species: str, species_to_a
         species_to_offsets = pickle.load(f)
     offset = species_to_offsets[species]
     spec_all_genes = species_to_all_gene_symbols[species]
-    return torch.tensor([spec_all_genes.index(k.lower()) + offset for k in adata.var_names]).long()
+
+    # index each gene symbol to its (first) row once, instead of a linear list search per gene
+    gene_to_row = {}
+    for row, gene_symbol in enumerate(spec_all_genes):
+        gene_to_row.setdefault(gene_symbol, row)
+    return torch.tensor([gene_to_row[k.lower()] + offset for k in adata.var_names], dtype=torch.long)
 
 def prepare_expression_counts_file(gene_expression: np.array, name: str, folder_path: str = "./") -> None:
     '''
@@ -1,45 +1,71 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from helical.constants.enums import LoggingType, LoggingLevel
 import os
 
-class Logger(): 
+# all file logging goes through a single queue, from which one background listener writes the records to the log file
+_LOG_QUEUE = queue.Queue(-1)
+_listener = None
+_queue_handler = None
+
+def _stop_listener() -> None:
+    """
+    Stop the listener, which writes the records left in the queue to the log file.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def _get_file_handler(log_filename: str, formatter: logging.Formatter, level: int) -> QueueHandler:
+    """
+    Get the handler that passes the log records to the shared queue, from which a background listener writes them to the log file.
+    This way, logging calls do not block on disk I/O. The handler and the listener are created on first use and the listener is stopped at exit.
+    """
+    global _listener, _queue_handler
+    if _queue_handler is None:
+        _listener = QueueListener(_LOG_QUEUE, logging.FileHandler(log_filename))
+        _listener.start()
+        atexit.register(_stop_listener)
+
+        # the record is formatted before it is put on the queue, the file handler then writes the formatted message as is
+        _queue_handler = QueueHandler(_LOG_QUEUE)
+        _queue_handler.setFormatter(formatter)
+        _queue_handler.setLevel(level)
+    return _queue_handler
+
+class Logger():
     def __init__(self, log_type: LoggingType, level: LoggingLevel):
-        
+
         self.log_filename = "debug.log"
         format = '%(asctime)s.%(msecs)03d %(name)s %(levelname)s %(message)s'
         datetime = '%Y-%m-%d, %H:%M:%S'
-        level = level.value
-        
-        if log_type == LoggingType.FILE_AND_CONSOLE:
-            logging.basicConfig(
-                format=format,
-                datefmt=datetime,
-                level=level,
-                handlers=[
-                    logging.FileHandler(self.log_filename),
-                    logging.StreamHandler(),
-                ],
-            )
-            
-        elif log_type == LoggingType.CONSOLE:
-            logging.basicConfig(
-                format=format,
-                datefmt=datetime,
-                level=level,
-                handlers=[
-                    logging.StreamHandler(),
-                ],
-            )            
-        
-        elif log_type == LoggingType.FILE:
-            logging.basicConfig(
-                format=format,
-                datefmt=datetime,
-                level=level,
-                handlers=[
-                    logging.FileHandler(self.log_filename),
-                ],
-            )
-            
-        else:
-            logging.disable = True
\ No newline at end of file
+        level = logging.getLevelName(level.value)
+        formatter = logging.Formatter(fmt=format, datefmt=datetime)
+
+        if log_type not in (LoggingType.FILE_AND_CONSOLE, LoggingType.CONSOLE, LoggingType.FILE):
+            logging.disable(logging.CRITICAL)
+            return
+
+        # handlers are added next to the ones already on the root logger (e.g. the one of the package or of the user), never replacing them
+        root = logging.getLogger()
+        handlers = []
+
+        if log_type in (LoggingType.FILE_AND_CONSOLE, LoggingType.CONSOLE) and not root.handlers:
+            handlers.append(logging.StreamHandler())
+
+        if log_type in (LoggingType.FILE_AND_CONSOLE, LoggingType.FILE):
+            handlers.append(_get_file_handler(self.log_filename, formatter, level))
+
+        for handler in handlers:
+            if handler in root.handlers:
+                continue
+            if handler.formatter is None:
+                handler.setFormatter(formatter)
+            root.addHandler(handler)
+
+        # let the records of the requested level reach the handlers
+        if handlers and root.getEffectiveLevel() > level:
+            root.setLevel(level)
@@ -1,6 +1,5 @@
 import logging 
 from pyensembl import genome_for_reference_name
-import pandas as pd
 from pyensembl import EnsemblRelease
 from pyensembl.species import human
 from pyensembl.species import Species
@@ -35,14 +34,17 @@ def map_gene_symbols_to_ensembl_ids(adata: AnnData, gene_names: str, species: Sp
     ensembl_release.download(overwrite=False)
     ensembl_release.index(overwrite=False)
 
-    adata.var['ensembl_id'] = pd.Series([None] * len(adata.var), index=adata.var.index)
     # we take the first reference assembly from the provided dictionary as default
     genome_reference = genome_for_reference_name(next(iter(species.reference_assemblies)))
-    for index, name in adata.var[gene_names].items():
+
+    # look up each distinct name once and map the whole column in one go
+    name_to_id = {}
+    for name in adata.var[gene_names].unique():
         try:
-            adata.var.at[index, 'ensembl_id'] = genome_reference.gene_ids_of_gene_name(name)[0]
+            name_to_id[name] = genome_reference.gene_ids_of_gene_name(name)[0]
         except:
-            continue
+            name_to_id[name] = None
+    adata.var['ensembl_id'] = adata.var[gene_names].map(name_to_id).astype(object)
     non_none_mappings = adata.var['ensembl_id'].notnull().sum()
     LOGGER.info(f"Mapped {non_none_mappings} genes to Ensembl IDs from a total of {adata.var.shape[0]} genes.")
     return adata
@@ -74,14 +76,17 @@ def map_ensembl_ids_to_gene_symbols(adata: AnnData, ensembl_id_key: str = "ensem
     ensembl_release.download(overwrite=False)
     ensembl_release.index(overwrite=False)
 
-    adata.var['gene_names'] = pd.Series([None] * len(adata.var), index=adata.var.index)
     # we take the first reference assembly from the provided dictionary as default
     genome_reference = genome_for_reference_name(next(iter(species.reference_assemblies)))
-    for index, ensembl_id in adata.var[ensembl_id_key].items():
+
+    # look up each distinct id once and map the whole column in one go
+    id_to_name = {}
+    for ensembl_id in adata.var[ensembl_id_key].unique():
         try:
-            adata.var.at[index, 'gene_names'] = genome_reference.gene_name_of_gene_id(ensembl_id)
+            id_to_name[ensembl_id] = genome_reference.gene_name_of_gene_id(ensembl_id)
         except:
-            continue
+            id_to_name[ensembl_id] = None
+    adata.var['gene_names'] = adata.var[ensembl_id_key].map(id_to_name).astype(object)
     non_none_mappings = adata.var['gene_names'].notnull().sum()
     LOGGER.info(f"Mapped {non_none_mappings} genes to Gene names from a total of {adata.var.shape[0]} Ensembl IDs.")
     return adata
\ No newline at end of file